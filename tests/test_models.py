@@ -166,30 +166,25 @@ class TestCaption(unittest.TestCase):
         self.assertIsNone(caption.identifier)
 
     def test_multi_lines(self):
-        caption = Caption(
-            start='00:00:07.000',
-            end='00:00:11.890',
-            text='Hello test!\nThis is the second line',
-            identifier='A test caption'
-            )
-        self.assertEqual(caption.text, 'Hello test!\nThis is the second line')
-        self.assertListEqual(
-            caption.lines,
-            ['Hello test!', 'This is the second line']
-            )
-
-    def test_multi_lines_accepts_list(self):
-        caption = Caption(
-            start='00:00:07.000',
-            end='00:00:11.890',
-            text=['Hello test!', 'This is the second line'],
-            identifier='A test caption'
-            )
-        self.assertEqual(caption.text, 'Hello test!\nThis is the second line')
-        self.assertListEqual(
-            caption.lines,
-            ['Hello test!', 'This is the second line']
-            )
+        # text may be provided as a single string or a list of lines
+        for text in ('Hello test!\nThis is the second line',
+                     ['Hello test!', 'This is the second line']
+                     ):
+            with self.subTest(text=text):
+                caption = Caption(
+                    start='00:00:07.000',
+                    end='00:00:11.890',
+                    text=text,
+                    identifier='A test caption'
+                    )
+                self.assertEqual(
+                    caption.text,
+                    'Hello test!\nThis is the second line'
+                    )
+                self.assertListEqual(
+                    caption.lines,
+                    ['Hello test!', 'This is the second line']
+                    )
 
     def test_cuetags(self):
         caption = Caption(
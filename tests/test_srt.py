@@ -143,10 +143,8 @@ class TestSRTModule(unittest.TestCase):
 
         srt.write(out, captions)
 
-        out.seek(0)
-
         self.assertEqual(
-            out.read(),
+            out.getvalue(),
             textwrap.dedent('''
                 1
                 00:00:00,500 --> 00:00:07,000
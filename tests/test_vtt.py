@@ -443,10 +443,8 @@ class TestVTTModule(unittest.TestCase):
             footer_comments
             )
 
-        out.seek(0)
-
         self.assertEqual(
-            out.read(),
+            out.getvalue(),
             textwrap.dedent('''
                 WEBVTT
 
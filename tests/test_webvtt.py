@@ -13,9 +13,150 @@ from webvtt.errors import MalformedFileError
 
 PATH_TO_SAMPLES = pathlib.Path(__file__).resolve().parent / 'samples'
 
+# frequently used samples, joined once instead of per test
+SAMPLE_VTT_FILE = PATH_TO_SAMPLES / 'sample.vtt'
+ONE_CAPTION_VTT_FILE = PATH_TO_SAMPLES / 'one_caption.vtt'
+
+# Payloads that do not vary between runs are dedented once at import
+# instead of on every test invocation.
+CARRIAGE_RETURN_PAYLOAD = textwrap.dedent('''\
+    WEBVTT\r
+    \r
+    00:00:00.500 --> 00:00:07.000\r
+    Caption text #1\r
+    \r
+    00:00:07.000 --> 00:00:11.890\r
+    Caption text #2\r
+    \r
+    00:00:11.890 --> 00:00:16.320\r
+    Caption text #3\r
+''')
+
+EXPECTED_CONTENT_FORMATTING = textwrap.dedent("""
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption test line 1
+    Caption test line 2
+
+    00:00:08.000 --> 00:00:15.000
+    Caption test line 3
+    Caption test line 4
+    """).strip() + '\n'
+
+EXPECTED_ONE_CAPTION_CONTENT = textwrap.dedent('''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+    ''').strip() + '\n'
+
+EXPECTED_APPENDED_CAPTION_CONTENT = textwrap.dedent('''
+    WEBVTT
+
+    00:00:00.500 --> 00:00:07.000
+    Caption text #1
+
+    00:00:07.000 --> 00:00:11.890
+    New caption text line1
+    New caption text line2
+    ''').strip() + '\n'
+
+EXPECTED_SAVE_IDENTIFIERS_LINES = (
+    'WEBVTT',
+    '',
+    '00:00:00.500 --> 00:00:07.000',
+    'Caption text #1',
+    '',
+    'second caption',
+    '00:00:07.000 --> 00:00:11.890',
+    'Caption text #2',
+    '',
+    '00:00:11.890 --> 00:00:16.320',
+    'Caption text #3',
+    '',
+    '4',
+    '00:00:16.320 --> 00:00:21.580',
+    'Caption text #4',
+    '',
+    '00:00:21.580 --> 00:00:23.880',
+    'Caption text #5',
+    '',
+    '00:00:23.880 --> 00:00:27.280',
+    'Caption text #6'
+    )
+
+EXPECTED_SAVE_UPDATED_IDENTIFIERS_LINES = (
+    'WEBVTT',
+    '',
+    'first caption',
+    '00:00:00.500 --> 00:00:07.000',
+    'Caption text #1',
+    '',
+    '00:00:07.000 --> 00:00:11.890',
+    'Caption text #2',
+    '',
+    '00:00:11.890 --> 00:00:16.320',
+    'Caption text #3',
+    '',
+    '44',
+    '00:00:16.320 --> 00:00:21.580',
+    'Caption text #4',
+    '',
+    '00:00:21.580 --> 00:00:23.880',
+    'Caption text #5',
+    '',
+    '00:00:23.880 --> 00:00:27.280',
+    'Caption text #6',
+    '',
+    'last caption',
+    '00:00:27.280 --> 00:00:29.200',
+    'Caption text #7'
+    )
+
+EXPECTED_SAVE_IDENTIFIERS = \
+    '\n'.join(EXPECTED_SAVE_IDENTIFIERS_LINES) + '\n'
+EXPECTED_SAVE_UPDATED_IDENTIFIERS = \
+    '\n'.join(EXPECTED_SAVE_UPDATED_IDENTIFIERS_LINES) + '\n'
+
 
 class TestWebVTT(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Parse the sample file once and share it across the tests
+        # that only read from it, instead of re-parsing per test.
+        cls.sample_vtt = webvtt.read(SAMPLE_VTT_FILE)
+        # One temporary directory for the whole class: tests that
+        # write files get their own subdirectory on demand, the rest
+        # pay no filesystem cost at all.
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def output_dir(self):
+        """Return a per-test output directory, created on first use."""
+        path = pathlib.Path(self.temp_dir.name) / self._testMethodName
+        path.mkdir(exist_ok=True)
+        return path
+
+    def stage_fixture(self, name):
+        """Make a sample file available in the test output directory.
+
+        The sample is hardlinked where the platform allows it, which
+        avoids copying bytes for fixtures the tests only read.
+        """
+        staged = self.output_dir() / name
+        try:
+            os.link(PATH_TO_SAMPLES / name, staged)
+        except OSError:
+            # the samples may live on another filesystem (or the
+            # platform may not support hardlinks): fall back to a copy
+            staged.write_text((PATH_TO_SAMPLES / name).read_text())
+        return staged
+
     def test_from_string(self):
         vtt = webvtt.from_string(textwrap.dedent("""
             WEBVTT
@@ -54,8 +195,16 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_write_captions(self):
-        out = io.StringIO()
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        # write through a text wrapper over a binary buffer, the
+        # shape used when writing to sockets or files opened in
+        # binary mode
+        out = io.BytesIO()
+        wrapper = io.TextIOWrapper(out,
+                                   encoding='utf-8',
+                                   newline='',
+                                   write_through=True
+                                   )
+        vtt = webvtt.read(ONE_CAPTION_VTT_FILE)
         new_caption = Caption(start='00:00:07.000',
                               end='00:00:11.890',
                               text=['New caption text line1',
@@ -63,27 +212,16 @@ class TestWebVTT(unittest.TestCase):
                                     ]
                               )
         vtt.captions.append(new_caption)
-        vtt.write(out)
-
-        out.seek(0)
+        vtt.write(wrapper)
 
         self.assertEqual(
-            out.read(),
-            textwrap.dedent('''
-                WEBVTT
-
-                00:00:00.500 --> 00:00:07.000
-                Caption text #1
-
-                00:00:07.000 --> 00:00:11.890
-                New caption text line1
-                New caption text line2
-            ''').strip() + '\n'
+            out.getvalue().decode('utf-8'),
+            EXPECTED_APPENDED_CAPTION_CONTENT
             )
 
     def test_write_captions_in_srt(self):
         out = io.StringIO()
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        vtt = webvtt.read(ONE_CAPTION_VTT_FILE)
         new_caption = Caption(start='00:00:07.000',
                               end='00:00:11.890',
                               text=['New caption text line1',
@@ -93,9 +231,8 @@ class TestWebVTT(unittest.TestCase):
         vtt.captions.append(new_caption)
         vtt.write(out, format='srt')
 
-        out.seek(0)
         self.assertEqual(
-            out.read(),
+            out.getvalue(),
             textwrap.dedent('''
                 1
                 00:00:00,500 --> 00:00:07,000
@@ -114,9 +251,8 @@ class TestWebVTT(unittest.TestCase):
         vtt = webvtt.read(PATH_TO_SAMPLES / 'cue_tags.vtt')
         vtt.write(out, format='srt')
 
-        out.seek(0)
         self.assertEqual(
-            out.read(),
+            out.getvalue(),
             textwrap.dedent('''
             1
             00:00:16,500 --> 00:00:18,500
@@ -142,7 +278,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_save_captions(self):
         with tempfile.NamedTemporaryFile('w', suffix='.vtt') as f:
-            f.write((PATH_TO_SAMPLES / 'one_caption.vtt').read_text())
+            f.write((ONE_CAPTION_VTT_FILE).read_text())
             f.flush()
 
             vtt = webvtt.read(f.name)
@@ -158,104 +294,82 @@ class TestWebVTT(unittest.TestCase):
 
             self.assertEqual(
                 pathlib.Path(f.name).read_text(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-
-                    00:00:07.000 --> 00:00:11.890
-                    New caption text line1
-                    New caption text line2
-                    ''').strip() + '\n'
+                EXPECTED_APPENDED_CAPTION_CONTENT
                 )
 
     def test_srt_conversion(self):
-        with tempfile.TemporaryDirectory() as td:
-            with open(pathlib.Path(td) / 'one_caption.srt', 'w') as f:
-                f.write((PATH_TO_SAMPLES / 'one_caption.srt').read_text())
+        td = self.output_dir()
+        staged = self.stage_fixture('one_caption.srt')
 
-            webvtt.from_srt(
-                pathlib.Path(td) / 'one_caption.srt'
-                ).save()
+        webvtt.from_srt(staged).save()
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption.vtt')
-                )
-            self.assertEqual(
-                (pathlib.Path(td) / 'one_caption.vtt').read_text(),
-                textwrap.dedent('''
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption text #1
-                    ''').strip() + '\n'
-                )
+        self.assertTrue(
+            os.path.exists(td / 'one_caption.vtt')
+            )
+        self.assertEqual(
+            (td / 'one_caption.vtt').read_text(),
+            EXPECTED_ONE_CAPTION_CONTENT
+            )
 
     def test_sbv_conversion(self):
-        with tempfile.TemporaryDirectory() as td:
-            with open(pathlib.Path(td) / 'two_captions.sbv', 'w') as f:
-                f.write(
-                    (PATH_TO_SAMPLES / 'two_captions.sbv').read_text()
-                    )
+        td = self.output_dir()
+        staged = self.stage_fixture('two_captions.sbv')
 
-            webvtt.from_sbv(
-                pathlib.Path(td) / 'two_captions.sbv'
-                ).save()
+        webvtt.from_sbv(staged).save()
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'two_captions.vtt')
-                )
-            self.assertEqual(
-                (pathlib.Path(td) / 'two_captions.vtt').read_text(),
-                textwrap.dedent('''
-                    WEBVTT
+        self.assertTrue(
+            os.path.exists(td / 'two_captions.vtt')
+            )
+        self.assertEqual(
+            (td / 'two_captions.vtt').read_text(),
+            textwrap.dedent('''
+                WEBVTT
 
-                    00:00:00.378 --> 00:00:11.378
-                    Caption text #1
+                00:00:00.378 --> 00:00:11.378
+                Caption text #1
 
-                    00:00:11.378 --> 00:00:12.305
-                    Caption text #2 (line 1)
-                    Caption text #2 (line 2)
-                    ''').strip() + '\n'
-                )
+                00:00:11.378 --> 00:00:12.305
+                Caption text #2 (line 1)
+                Caption text #2 (line 2)
+                ''').strip() + '\n'
+            )
 
     def test_save_to_other_location(self):
-        with tempfile.TemporaryDirectory() as td:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(td)
+        td = self.output_dir()
+        webvtt.read(
+            ONE_CAPTION_VTT_FILE
+            ).save(str(td))
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption.vtt')
-                )
+        self.assertTrue(
+            os.path.exists(td / 'one_caption.vtt')
+            )
 
     def test_save_specific_filename(self):
-        with tempfile.TemporaryDirectory() as td:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(
-                    pathlib.Path(td) / 'one_caption_new.vtt'
-                )
+        td = self.output_dir()
+        webvtt.read(
+            ONE_CAPTION_VTT_FILE
+            ).save(
+                td / 'one_caption_new.vtt'
+            )
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption_new.vtt')
-                )
+        self.assertTrue(
+            os.path.exists(td / 'one_caption_new.vtt')
+            )
 
     def test_save_specific_filename_no_extension(self):
-        with tempfile.TemporaryDirectory() as td:
-            webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
-                ).save(
-                    pathlib.Path(td) / 'one_caption_new'
-                )
+        td = self.output_dir()
+        webvtt.read(
+            ONE_CAPTION_VTT_FILE
+            ).save(
+                td / 'one_caption_new'
+            )
 
-            self.assertTrue(
-                os.path.exists(pathlib.Path(td) / 'one_caption_new.vtt')
-                )
+        self.assertTrue(
+            os.path.exists(td / 'one_caption_new.vtt')
+            )
 
     def test_from_buffer(self):
-        with open(PATH_TO_SAMPLES / 'sample.vtt', 'r', encoding='utf-8') as f:
+        with open(SAMPLE_VTT_FILE, 'r', encoding='utf-8') as f:
             vtt = webvtt.from_buffer(f)
             self.assertEqual(len(vtt), 16)
             self.assertEqual(
@@ -281,7 +395,7 @@ class TestWebVTT(unittest.TestCase):
                     ).strip())
 
     def test_deprecated_read_buffer(self):
-        with open(PATH_TO_SAMPLES / 'sample.vtt', 'r', encoding='utf-8') as f:
+        with open(SAMPLE_VTT_FILE, 'r', encoding='utf-8') as f:
             with warnings.catch_warnings(record=True) as warns:
                 warnings.simplefilter('always')
                 vtt = webvtt.read_buffer(f)
@@ -294,7 +408,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_read_memory_buffer(self):
         buffer = io.StringIO(
-            (PATH_TO_SAMPLES / 'sample.vtt').read_text()
+            (SAMPLE_VTT_FILE).read_text()
             )
 
         self.assertIsInstance(
@@ -304,19 +418,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_read_memory_buffer_carriage_return(self):
         """https://github.com/glut23/webvtt-py/issues/29"""
-        buffer = io.StringIO(textwrap.dedent('''\
-            WEBVTT\r
-            \r
-            00:00:00.500 --> 00:00:07.000\r
-            Caption text #1\r
-            \r
-            00:00:07.000 --> 00:00:11.890\r
-            Caption text #2\r
-            \r
-            00:00:11.890 --> 00:00:16.320\r
-            Caption text #3\r
-        ''')
-        )
+        buffer = io.StringIO(CARRIAGE_RETURN_PAYLOAD)
 
         self.assertEqual(
             len(webvtt.from_buffer(buffer).captions),
@@ -459,7 +561,7 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_captions(self):
-        captions = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt').captions
+        captions = self.sample_vtt.captions
         self.assertIsInstance(
             captions,
             list
@@ -467,7 +569,7 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual(len(captions), 16)
 
     def test_sequence_iteration(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')
+        vtt = self.sample_vtt
         self.assertIsInstance(vtt[0], Caption)
         self.assertEqual(len(vtt), len(vtt.captions))
 
@@ -478,12 +580,11 @@ class TestWebVTT(unittest.TestCase):
             )
 
     def test_save_with_path_to_dir_no_filename(self):
-        with tempfile.TemporaryDirectory() as td:
-            self.assertRaises(
-                webvtt.errors.MissingFilenameError,
-                webvtt.WebVTT().save,
-                td
-                )
+        self.assertRaises(
+            webvtt.errors.MissingFilenameError,
+            webvtt.WebVTT().save,
+            str(self.output_dir())
+            )
 
     def test_set_styles_from_text(self):
         style = Style('::cue(b) {\n  color: peachpuff;\n}')
@@ -500,31 +601,9 @@ class TestWebVTT(unittest.TestCase):
                     f.name
                     )
 
-            self.assertListEqual(
-                pathlib.Path(f.name).read_text().splitlines(),
-                [
-                    'WEBVTT',
-                    '',
-                    '00:00:00.500 --> 00:00:07.000',
-                    'Caption text #1',
-                    '',
-                    'second caption',
-                    '00:00:07.000 --> 00:00:11.890',
-                    'Caption text #2',
-                    '',
-                    '00:00:11.890 --> 00:00:16.320',
-                    'Caption text #3',
-                    '',
-                    '4',
-                    '00:00:16.320 --> 00:00:21.580',
-                    'Caption text #4',
-                    '',
-                    '00:00:21.580 --> 00:00:23.880',
-                    'Caption text #5',
-                    '',
-                    '00:00:23.880 --> 00:00:27.280',
-                    'Caption text #6'
-                    ]
+            self.assertMultiLineEqual(
+                pathlib.Path(f.name).read_text(),
+                EXPECTED_SAVE_IDENTIFIERS
                 )
 
     def test_save_updated_identifiers(self):
@@ -542,35 +621,9 @@ class TestWebVTT(unittest.TestCase):
         with tempfile.NamedTemporaryFile('w', suffix='.vtt') as f:
             vtt.save(f.name)
 
-            self.assertListEqual(
-                pathlib.Path(f.name).read_text().splitlines(),
-                [
-                    'WEBVTT',
-                    '',
-                    'first caption',
-                    '00:00:00.500 --> 00:00:07.000',
-                    'Caption text #1',
-                    '',
-                    '00:00:07.000 --> 00:00:11.890',
-                    'Caption text #2',
-                    '',
-                    '00:00:11.890 --> 00:00:16.320',
-                    'Caption text #3',
-                    '',
-                    '44',
-                    '00:00:16.320 --> 00:00:21.580',
-                    'Caption text #4',
-                    '',
-                    '00:00:21.580 --> 00:00:23.880',
-                    'Caption text #5',
-                    '',
-                    '00:00:23.880 --> 00:00:27.280',
-                    'Caption text #6',
-                    '',
-                    'last caption',
-                    '00:00:27.280 --> 00:00:29.200',
-                    'Caption text #7'
-                    ]
+            self.assertMultiLineEqual(
+                pathlib.Path(f.name).read_text(),
+                EXPECTED_SAVE_UPDATED_IDENTIFIERS
                 )
 
     def test_content_formatting(self):
@@ -590,29 +643,19 @@ class TestWebVTT(unittest.TestCase):
 
         self.assertEqual(
             webvtt.WebVTT(captions=captions).content,
-            textwrap.dedent("""
-                    WEBVTT
-
-                    00:00:00.500 --> 00:00:07.000
-                    Caption test line 1
-                    Caption test line 2
-
-                    00:00:08.000 --> 00:00:15.000
-                    Caption test line 3
-                    Caption test line 4
-                    """).strip() + '\n'
+            EXPECTED_CONTENT_FORMATTING
             )
 
     def test_repr(self):
-        test_file = PATH_TO_SAMPLES / 'sample.vtt'
+        test_file = SAMPLE_VTT_FILE
         self.assertEqual(
-            repr(webvtt.read(test_file)),
+            repr(self.sample_vtt),
             f"<WebVTT file='{test_file}' encoding='utf-8'>"
             )
 
     def test_str(self):
         self.assertEqual(
-            str(webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')),
+            str(self.sample_vtt),
             textwrap.dedent("""
                 00:00:00.500 00:00:07.000 Caption text #1
                 00:00:07.000 00:00:11.890 Caption text #2
@@ -649,7 +692,7 @@ class TestWebVTT(unittest.TestCase):
 
     def test_total_length(self):
         self.assertEqual(
-            webvtt.read(PATH_TO_SAMPLES / 'sample.vtt').total_length,
+            self.sample_vtt.total_length,
             64
             )
 
@@ -680,7 +723,7 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual('Caption text #3', vtt.captions[1].text)
 
     def test_parse_get_caption_data(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'one_caption.vtt')
+        vtt = webvtt.read(ONE_CAPTION_VTT_FILE)
         self.assertEqual(vtt.captions[0].start_in_seconds, 0)
         self.assertEqual(vtt.captions[0].start, '00:00:00.500')
         self.assertEqual(vtt.captions[0].end_in_seconds, 7)
@@ -697,7 +740,7 @@ class TestWebVTT(unittest.TestCase):
         self.assertEqual(len(vtt.captions), 4)
 
     def test_timestamps_format(self):
-        vtt = webvtt.read(PATH_TO_SAMPLES / 'sample.vtt')
+        vtt = self.sample_vtt
         self.assertEqual(vtt.captions[2].start, '00:00:11.890')
         self.assertEqual(vtt.captions[2].end, '00:00:16.320')
 
@@ -1137,6 +1180,11 @@ class TestParseSRT(unittest.TestCase):
 
 class TestParseSBV(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.sample_sbv = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        cls.sample_vtt = webvtt.read(SAMPLE_VTT_FILE)
+
     def test_parse_empty_file(self):
         self.assertRaises(
             MalformedFileError,
@@ -1154,13 +1202,13 @@ class TestParseSBV(unittest.TestCase):
 
     def test_total_length(self):
         self.assertEqual(
-            webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv').total_length,
+            self.sample_sbv.total_length,
             16
             )
 
     def test_parse_captions(self):
         self.assertEqual(
-            len(webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv').captions),
+            len(self.sample_sbv.captions),
             5
             )
 
@@ -1188,21 +1236,21 @@ class TestParseSBV(unittest.TestCase):
             )
 
     def test_timestamps_format(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].start, '00:00:11.378')
         self.assertEqual(vtt.captions[1].end, '00:00:12.305')
 
     def test_timestamps_in_seconds(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].start_in_seconds, 11)
         self.assertEqual(vtt.captions[1].end_in_seconds, 12)
 
     def test_get_caption_text(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(vtt.captions[1].text, 'Caption text #2')
 
     def test_get_caption_text_multiline(self):
-        vtt = webvtt.from_sbv(PATH_TO_SAMPLES / 'sample.sbv')
+        vtt = self.sample_sbv
         self.assertEqual(
             vtt.captions[2].text,
             'Caption text #3 (line 1)\nCaption text #3 (line 2)'
@@ -1226,7 +1274,7 @@ class TestParseSBV(unittest.TestCase):
     def test_save_file_with_bom(self):
         with tempfile.NamedTemporaryFile('r', suffix='.vtt') as f:
             webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
+                ONE_CAPTION_VTT_FILE
                 ).save(f.name, add_bom=True)
             self.assertEqual(
                 f.read(),
@@ -1289,7 +1337,7 @@ class TestParseSBV(unittest.TestCase):
     def test_save_file_with_encoding(self):
         with tempfile.NamedTemporaryFile('rb', suffix='.vtt') as f:
             webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
+                ONE_CAPTION_VTT_FILE
             ).save(f.name,
                    encoding='utf-32-le'
                    )
@@ -1306,7 +1354,7 @@ class TestParseSBV(unittest.TestCase):
     def test_save_file_with_encoding_and_bom(self):
         with tempfile.NamedTemporaryFile('rb', suffix='.vtt') as f:
             webvtt.read(
-                PATH_TO_SAMPLES / 'one_caption.vtt'
+                ONE_CAPTION_VTT_FILE
             ).save(f.name,
                    encoding='utf-32-le',
                    add_bom=True
@@ -1366,9 +1414,7 @@ class TestParseSBV(unittest.TestCase):
                 )
 
     def test_iter_slice(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = self.sample_vtt
         slice_of_captions = vtt.iter_slice(start='00:00:11.000',
                                            end='00:00:27.000'
                                            )
@@ -1382,9 +1428,7 @@ class TestParseSBV(unittest.TestCase):
             next(slice_of_captions)
 
     def test_iter_slice_no_start_time(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = self.sample_vtt
         slice_of_captions = vtt.iter_slice(end='00:00:27.000')
         for expected_caption in (vtt.captions[0],
                                  vtt.captions[1],
@@ -1398,9 +1442,7 @@ class TestParseSBV(unittest.TestCase):
             next(slice_of_captions)
 
     def test_iter_slice_no_end_time(self):
-        vtt = webvtt.read(
-                PATH_TO_SAMPLES / 'sample.vtt'
-                )
+        vtt = self.sample_vtt
         slice_of_captions = vtt.iter_slice(start='00:00:47.000')
         for expected_caption in (vtt.captions[11],
                                  vtt.captions[12],